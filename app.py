@@ -2,28 +2,219 @@
 Optimized for Vercel deployment with minimal dependencies.
 """
 
-from flask import Flask, render_template, jsonify
-import pandas as pd
-import json
+from flask import Flask, Response, render_template, jsonify, request
+from functools import lru_cache
 from pathlib import Path
+import orjson
 import os
+import time
+
+# pandas and numpy are imported inside the functions that use them so a cold
+# start (and the /health endpoint) only pays for Flask and orjson.
 
 app = Flask(__name__)
 
 # Project paths - look for CSV files in root directory for Vercel deployment
 project_root = Path(__file__).resolve().parent
+CHART_VALUE_SCALE = 100  # chart values are sent as integer cents
+PORTFOLIO_FILE = project_root / "chatgpt_portfolio_update.csv"
+TRADE_FILE = project_root / "chatgpt_trade_log.csv"
+
+# API responses may be reused by browsers and the Vercel edge for this long;
+# the ETag still lets them revalidate cheaply once it expires.
+API_MAX_AGE = 300
+
+# /health is polled by uptime monitors, so file presence is re-checked at most
+# once per this many seconds.
+HEALTH_CHECK_TTL = 5
+
+# Explicit column types spare pandas per-column type inference and keep a
+# stray blank cell from turning a numeric column into strings.
+PORTFOLIO_DTYPES = {
+    'Ticker': 'category',
+    'Shares': 'float64',
+    'Buy Price': 'float64',
+    'Cost Basis': 'float64',
+    'Stop Loss': 'float64',
+    'Current Price': 'float64',
+    'Total Value': 'float64',
+    'PnL': 'float64',
+    'Cash Balance': 'float64',
+    'Total Equity': 'float64',
+}
+TRADE_DTYPES = {
+    'Ticker': 'category',
+    'Shares Bought': 'float64',
+    'Buy Price': 'float64',
+    'Cost Basis': 'float64',
+    'PnL': 'float64',
+    'Shares Sold': 'float64',
+    'Sell Price': 'float64',
+}
+
+
+@lru_cache(maxsize=4)
+def _read_csv_cached(path_str, mtime_ns, size, parse):
+    """Parse a CSV file once per (path, mtime, size) triple.
+
+    The stat fields are only part of the cache key: editing the file changes
+    them and forces a fresh parse on the next request. ``parse`` reads the
+    file, so any post-processing it does is cached along with the frame.
+    """
+    return parse(path_str)
+
+
+def _load_csv(csv_file, parse):
+    """Return the cached DataFrame for ``csv_file`` or an empty frame."""
+    import pandas as pd
+
+    try:
+        st = csv_file.stat()
+    except FileNotFoundError:
+        return pd.DataFrame()
+    df = _read_csv_cached(str(csv_file), st.st_mtime_ns, st.st_size, parse)
+    # Shallow copy so callers cannot mutate the cached frame's structure
+    return df.copy(deep=False)
+
+
+def _parse_portfolio(path_str):
+    """Read the portfolio CSV and precompute the slices requests need.
+
+    Rows are sorted by date and ``df.attrs`` carries the latest date, the row
+    offset where that date starts and the positions of the TOTAL summary
+    rows, so endpoints can slice with ``iloc`` instead of re-scanning the
+    whole frame. The dashboard's chart JSON is built here too, so it is
+    produced once per file version rather than once per page view.
+    """
+    import numpy as np
+    import pandas as pd
+
+    df = pd.read_csv(
+        path_str,
+        dtype=PORTFOLIO_DTYPES,
+        parse_dates=['Date'],
+        date_format='%Y-%m-%d',
+        skipinitialspace=True,
+    )
+    if df.empty:
+        return df
+    # Rows with a blank Date sort first so the tail holds the latest real
+    # date, matching the Date.max() this replaced (which skipped NaT)
+    df.sort_values('Date', kind='stable', inplace=True, ignore_index=True,
+                   na_position='first')
+    missing = int(df['Date'].isna().sum())
+    dates = df['Date'].to_numpy()[missing:]
+    if len(dates):
+        df.attrs['latest_date'] = df['Date'].iloc[-1]
+        df.attrs['latest_start'] = missing + int(dates.searchsorted(dates[-1]))
+    else:
+        df.attrs['latest_date'] = None
+        df.attrs['latest_start'] = len(df)
+    # Compare the small integer category codes rather than the strings
+    tickers = df['Ticker'].cat
+    if 'TOTAL' in tickers.categories:
+        total_code = tickers.categories.get_loc('TOTAL')
+        df.attrs['total_idx'] = np.flatnonzero(tickers.codes.to_numpy() == total_code)
+    else:
+        df.attrs['total_idx'] = np.empty(0, dtype=np.intp)
+    df.attrs['chart_json'] = create_simple_chart_data(_total_rows(df))
+    return df
+
+
+def _total_rows(portfolio):
+    """Return the TOTAL summary rows, in date order, via the cached index."""
+    return portfolio.iloc[portfolio.attrs['total_idx']]
+
+
+def _parse_trades(path_str):
+    """Read the trade log CSV."""
+    import pandas as pd
+
+    return pd.read_csv(path_str, dtype=TRADE_DTYPES, skipinitialspace=True)
+
+
+def _records(df):
+    """Convert rows to dicts, rendering a datetime ``Date`` as YYYY-MM-DD."""
+    if 'Date' in df and df['Date'].dtype.kind == 'M':
+        df = df.assign(Date=_date_strings(df['Date']))
+    return df.to_dict('records')
+
+
+def _date_strings(dates):
+    """Format a date column as YYYY-MM-DD strings in one numpy pass."""
+    return dates.to_numpy(dtype='datetime64[D]').astype('U10')
+
+
+def _tail_records(df, n):
+    """Return the last ``n`` rows as dicts built by zipping column slices.
+
+    This skips DataFrame.to_dict's per-row machinery for small tails. numpy's
+    ``tolist`` yields native Python values, so datetime columns would come
+    back as integers; use it on frames whose dates are still strings.
+    """
+    cols = df.columns.tolist()
+    arrays = [df[col].to_numpy()[-n:].tolist() for col in cols]
+    return [dict(zip(cols, row)) for row in zip(*arrays)]
+
+
+def _portfolio_payload():
+    """Rows from the most recent portfolio date."""
+    portfolio = load_portfolio_data()
+    if portfolio.empty:
+        return []
+    return _records(portfolio.iloc[portfolio.attrs['latest_start']:])
+
+
+def _performance_payload():
+    """TOTAL rows for performance tracking."""
+    portfolio = load_portfolio_data()
+    if portfolio.empty:
+        return []
+    return _records(_total_rows(portfolio))
+
+
+def _trades_payload():
+    """Every row of the trade log."""
+    trades = load_trade_data()
+    if trades.empty:
+        return []
+    return _records(trades)
+
+
+@lru_cache(maxsize=8)
+def _serialized(build, mtime_ns, size):
+    """Serialize an API payload once per version of its source CSV.
+
+    Returns the JSON body and the ETag identifying that version.
+    """
+    body = orjson.dumps(build(), option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC)
+    return body, f"{build.__name__.strip('_')}-{mtime_ns:x}-{size:x}"
+
+
+def _cached_json_response(build, csv_file):
+    """Serve ``build()`` as JSON with an ETag tied to ``csv_file``.
+
+    Repeat requests reuse the serialized bytes, and clients or CDNs sending a
+    matching If-None-Match get an empty 304.
+    """
+    try:
+        st = csv_file.stat()
+    except FileNotFoundError:
+        return jsonify([])
+    body, etag = _serialized(build, st.st_mtime_ns, st.st_size)
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag, weak=True)
+    response.cache_control.public = True
+    response.cache_control.max_age = API_MAX_AGE
+    return response.make_conditional(request)
 
 
 def load_portfolio_data():
     """Load portfolio data from CSV file."""
-    portfolio_file = project_root / "chatgpt_portfolio_update.csv"
-    
+    import pandas as pd
+
     try:
-        if portfolio_file.exists():
-            df = pd.read_csv(portfolio_file)
-            return df
-        else:
-            return pd.DataFrame()
+        return _load_csv(PORTFOLIO_FILE, _parse_portfolio)
     except Exception as e:
         print(f"Error loading portfolio data: {e}")
         return pd.DataFrame()
@@ -31,14 +222,10 @@ def load_portfolio_data():
 
 def load_trade_data():
     """Load trade log data from CSV file."""
-    trade_file = project_root / "chatgpt_trade_log.csv"
-    
+    import pandas as pd
+
     try:
-        if trade_file.exists():
-            df = pd.read_csv(trade_file)
-            return df
-        else:
-            return pd.DataFrame()
+        return _load_csv(TRADE_FILE, _parse_trades)
     except Exception as e:
         print(f"Error loading trade data: {e}")
         return pd.DataFrame()
@@ -46,23 +233,30 @@ def load_trade_data():
 
 def create_simple_chart_data(total_rows):
     """Create simple chart data without plotly dependency."""
+    import numpy as np
+
     if total_rows.empty:
-        return json.dumps({})
+        return "{}"
     
     try:
+        equity = total_rows['Total Equity'].to_numpy(dtype='float64')
+        has_value = np.isfinite(equity)
         # Convert dates to strings for JSON serialization
-        dates = pd.to_datetime(total_rows['Date']).dt.strftime('%Y-%m-%d').tolist()
-        values = total_rows['Total Equity'].tolist()
+        dates = _date_strings(total_rows['Date'])[has_value].tolist()
+        # Integer cents are a fraction of the size of full-precision floats
+        # and hit orjson's numpy int32 fast path; the client divides by scale
+        values = np.rint(equity[has_value] * CHART_VALUE_SCALE).astype(np.int32)
         
         chart_data = {
             "dates": dates,
             "values": values,
+            "scale": CHART_VALUE_SCALE,
             "title": "Portfolio Performance Over Time"
         }
-        return json.dumps(chart_data)
+        return orjson.dumps(chart_data, option=orjson.OPT_SERIALIZE_NUMPY).decode()
     except Exception as e:
         print(f"Error creating chart data: {e}")
-        return json.dumps({})
+        return "{}"
 
 
 @app.route('/')
@@ -80,27 +274,24 @@ def dashboard():
     if not portfolio.empty:
         try:
             # Get latest portfolio positions (non-TOTAL rows)
-            latest_date = portfolio['Date'].max()
-            latest_portfolio = portfolio[
-                (portfolio['Date'] == latest_date) & 
-                (portfolio['Ticker'] != 'TOTAL')
-            ]
+            latest_date = portfolio.attrs['latest_date']
+            latest_rows = portfolio.iloc[portfolio.attrs['latest_start']:]
+            latest_portfolio = latest_rows[latest_rows['Ticker'].to_numpy() != 'TOTAL']
             portfolio_data = latest_portfolio.to_dict('records')
             
-            # Get performance data (TOTAL rows)
-            total_rows = portfolio[portfolio['Ticker'] == 'TOTAL'].copy()
-            total_rows = total_rows.sort_values('Date')
+            # Get performance data (TOTAL rows, already in date order)
+            total_rows = _total_rows(portfolio)
             
             if not total_rows.empty:
-                # Create simple chart data
-                chart_data = create_simple_chart_data(total_rows)
+                # Chart JSON is built once per cached portfolio load
+                chart_data = portfolio.attrs['chart_json']
                 
                 # Latest statistics
                 latest_stats = {
                     'total_equity': f"${total_rows['Total Equity'].iloc[-1]:,.2f}",
                     'cash_balance': f"${total_rows['Cash Balance'].iloc[-1]:,.2f}",
                     'total_pnl': f"${total_rows['PnL'].iloc[-1]:,.2f}",
-                    'last_updated': latest_date
+                    'last_updated': latest_date.strftime('%Y-%m-%d') if latest_date is not None else ''
                 }
         except Exception as e:
             print(f"Error processing portfolio data: {e}")
@@ -109,8 +300,7 @@ def dashboard():
     trade_data = []
     if not trades.empty:
         try:
-            recent_trades = trades.tail(10)
-            trade_data = recent_trades.to_dict('records')
+            trade_data = _tail_records(trades, 10)
         except Exception as e:
             print(f"Error processing trade data: {e}")
     
@@ -127,15 +317,7 @@ def dashboard():
 def api_portfolio():
     """API endpoint for portfolio data."""
     try:
-        portfolio = load_portfolio_data()
-        
-        if not portfolio.empty:
-            # Return recent portfolio data
-            latest_date = portfolio['Date'].max()
-            latest_data = portfolio[portfolio['Date'] == latest_date]
-            return latest_data.to_json(orient='records')
-        else:
-            return jsonify([])
+        return _cached_json_response(_portfolio_payload, PORTFOLIO_FILE)
     except Exception as e:
         print(f"Error in portfolio API: {e}")
         return jsonify([])
@@ -145,14 +327,7 @@ def api_portfolio():
 def api_performance():
     """API endpoint for performance data."""
     try:
-        portfolio = load_portfolio_data()
-        
-        if not portfolio.empty:
-            # Return TOTAL rows for performance tracking
-            total_rows = portfolio[portfolio['Ticker'] == 'TOTAL']
-            return total_rows.to_json(orient='records')
-        else:
-            return jsonify([])
+        return _cached_json_response(_performance_payload, PORTFOLIO_FILE)
     except Exception as e:
         print(f"Error in performance API: {e}")
         return jsonify([])
@@ -162,22 +337,27 @@ def api_performance():
 def api_trades():
     """API endpoint for trade data."""
     try:
-        trades = load_trade_data()
-        
-        if not trades.empty:
-            return trades.to_json(orient='records')
-        else:
-            return jsonify([])
+        return _cached_json_response(_trades_payload, TRADE_FILE)
     except Exception as e:
         print(f"Error in trades API: {e}")
         return jsonify([])
 
 
+@lru_cache(maxsize=1)
+def _file_flags(tick):
+    """Report whether the data files exist using a single directory scan.
+
+    ``tick`` only keys the cache, so the scan reruns once per TTL window.
+    """
+    with os.scandir(project_root) as entries:
+        names = {entry.name for entry in entries}
+    return PORTFOLIO_FILE.name in names, TRADE_FILE.name in names
+
+
 @app.route('/health')
 def health_check():
     """Health check endpoint."""
-    portfolio_exists = (project_root / "chatgpt_portfolio_update.csv").exists()
-    trade_exists = (project_root / "chatgpt_trade_log.csv").exists()
+    portfolio_exists, trade_exists = _file_flags(int(time.time() // HEALTH_CHECK_TTL))
     
     return jsonify({
         'status': 'healthy',
@@ -1,13 +1,14 @@
 #!/usr/bin/env python3
-"""Daily trading update script for automated operations."""
+"""Daily trading update script for automated operations.
+
+Run from the project root as ``python -m scripts.daily_update``.
+"""
 
 import os
 import sys
 from pathlib import Path
 
-# Add the project root to the Python path
 project_root = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(project_root))
 
 from trading_script import process_portfolio, daily_results, load_latest_portfolio_state, set_data_dir
 
@@ -1,19 +1,26 @@
 #!/usr/bin/env python3
-"""Generate reports and visualizations for the trading experiment."""
+"""Generate reports and visualizations for the trading experiment.
+
+Run from the project root as ``python -m scripts.generate_reports``.
+"""
 
 import os
 import sys
 from pathlib import Path
+import numpy as np
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
 from datetime import datetime
-import json
-import html
+import orjson
+import re
 
-# Add the project root to the Python path
 project_root = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(project_root))
+
+REPORT_TEMPLATE = Path(__file__).resolve().parent / "report_template.html"
+# Performance chart canvas, in SVG user units
+CHART_WIDTH = 1200
+CHART_HEIGHT = 700
+CHART_MARGIN = (70, 40, 90, 90)  # top, right, bottom, left
+_TEMPLATE_FIELD = re.compile(rb"\{(PORTFOLIO_JSON|TRADES_JSON|TOTAL_TRADES|LAST_UPDATED)\}")
 
 
 def create_reports_directory():
@@ -27,278 +34,153 @@ def generate_performance_chart(data_dir: Path, reports_dir: Path):
     """Generate performance chart comparing portfolio to market indices."""
     portfolio_file = data_dir / "chatgpt_portfolio_update.csv"
     
-    if not portfolio_file.exists():
+    # Load only the columns the chart needs, with explicit types
+    try:
+        df = pd.read_csv(
+            portfolio_file,
+            usecols=['Date', 'Ticker', 'Total Equity'],
+            dtype={'Ticker': 'category', 'Total Equity': 'float64'},
+            parse_dates=['Date'],
+            date_format='%Y-%m-%d',
+            skipinitialspace=True,
+        )
+    except FileNotFoundError:
         print("Warning: Portfolio data not found, skipping chart generation")
         return
     
-    # Load portfolio data
-    df = pd.read_csv(portfolio_file)
-    df['Date'] = pd.to_datetime(df['Date'])
-    
     # Filter for TOTAL rows (summary data)
-    total_rows = df[df['Ticker'] == 'TOTAL'].copy()
+    total_rows = df[df['Ticker'] == 'TOTAL']
     
     if total_rows.empty:
         print("Warning: No TOTAL summary rows found in portfolio data")
         return
     
-    # Create the performance chart
-    plt.figure(figsize=(12, 8))
-    plt.plot(total_rows['Date'], total_rows['Total Equity'], 
-             label='ChatGPT Portfolio', linewidth=2, color='#2E8B57')
-    
-    plt.title('ChatGPT Micro-Cap Trading Experiment Performance', fontsize=16, fontweight='bold')
-    plt.xlabel('Date', fontsize=12)
-    plt.ylabel('Portfolio Value ($)', fontsize=12)
-    plt.legend()
-    plt.grid(True, alpha=0.3)
-    
-    # Format x-axis dates
-    plt.gca().xaxis.set_major_formatter(mdates.DateFormatter('%Y-%m-%d'))
-    plt.gca().xaxis.set_major_locator(mdates.WeekdayLocator())
-    plt.xticks(rotation=45)
-    
-    plt.tight_layout()
+    total_rows = total_rows.dropna(subset=['Total Equity'])
+    if total_rows.empty:
+        print("Warning: No Total Equity values found in portfolio data")
+        return
     
     # Save the chart
-    chart_path = reports_dir / "performance_chart.png"
-    plt.savefig(chart_path, dpi=300, bbox_inches='tight')
-    plt.close()
+    chart_path = reports_dir / "performance_chart.svg"
+    chart_path.write_text(_equity_chart_svg(
+        total_rows['Date'].to_numpy(dtype='datetime64[D]'),
+        total_rows['Total Equity'].to_numpy(dtype='float64'),
+    ))
     
     print(f"✅ Performance chart saved to {chart_path}")
 
 
+def _equity_chart_svg(dates: np.ndarray, values: np.ndarray) -> str:
+    """Render the equity curve as a standalone SVG line chart.
+
+    Points are placed on a time axis (so gaps between trading days keep their
+    width) and scaled to the value range, with five horizontal gridlines and
+    up to eight date labels.
+    """
+    top, right, bottom, left = CHART_MARGIN
+    plot_w = CHART_WIDTH - left - right
+    plot_h = CHART_HEIGHT - top - bottom
+    
+    days = (dates - dates[0]).astype('float64')
+    span = days[-1] or 1.0
+    lo, hi = float(values.min()), float(values.max())
+    if hi == lo:
+        lo, hi = lo - 1.0, hi + 1.0
+    
+    xs = left + days / span * plot_w
+    ys = top + (hi - values) / (hi - lo) * plot_h
+    points = " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+    
+    grid = []
+    for value in np.linspace(lo, hi, 5):
+        y = top + (hi - value) / (hi - lo) * plot_h
+        grid.append(
+            f'<line x1="{left}" y1="{y:.1f}" x2="{left + plot_w}" y2="{y:.1f}" '
+            f'stroke="#000" stroke-opacity="0.1"/>'
+            f'<text x="{left - 10}" y="{y + 4:.1f}" text-anchor="end">${value:,.2f}</text>'
+        )
+    for i in np.unique(np.linspace(0, len(dates) - 1, min(len(dates), 8)).round().astype(int)):
+        x = xs[i]
+        y = top + plot_h + 20
+        grid.append(
+            f'<text x="{x:.1f}" y="{y}" text-anchor="end" '
+            f'transform="rotate(-45 {x:.1f} {y})">{dates[i]}</text>'
+        )
+    
+    return (
+        f'<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 {CHART_WIDTH} {CHART_HEIGHT}" '
+        f'font-family="sans-serif" font-size="13" fill="#333">'
+        f'<rect width="100%" height="100%" fill="#fff"/>'
+        f'<text x="{CHART_WIDTH / 2}" y="{top / 2}" text-anchor="middle" font-size="22" '
+        f'font-weight="bold">ChatGPT Micro-Cap Trading Experiment Performance</text>'
+        f'{"".join(grid)}'
+        f'<polyline points="{points}" fill="none" stroke="#2E8B57" stroke-width="2.5" '
+        f'stroke-linejoin="round"/>'
+        f'<text x="{left + plot_w / 2}" y="{CHART_HEIGHT - 10}" text-anchor="middle">Date</text>'
+        f'<text x="20" y="{top + plot_h / 2}" text-anchor="middle" '
+        f'transform="rotate(-90 20 {top + plot_h / 2})">Portfolio Value ($)</text>'
+        f'<line x1="{left + plot_w - 170}" y1="{top + 12}" x2="{left + plot_w - 140}" y2="{top + 12}" '
+        f'stroke="#2E8B57" stroke-width="2.5"/>'
+        f'<text x="{left + plot_w - 132}" y="{top + 16}">ChatGPT Portfolio</text>'
+        f'</svg>\n'
+    )
+
+
+def _tail_records(df: pd.DataFrame, n: int) -> list[dict]:
+    """Return the last ``n`` rows as dicts built by zipping column slices."""
+    cols = df.columns.tolist()
+    arrays = [df[col].to_numpy()[-n:].tolist() for col in cols]
+    return [dict(zip(cols, row)) for row in zip(*arrays)]
+
+
+def _script_json(obj) -> bytes:
+    """Encode ``obj`` for a ``<script type="application/json">`` block.
+
+    The payload is never parsed as HTML, so only ``</`` needs escaping to keep
+    a string value from closing the script element early.
+    """
+    return orjson.dumps(obj).replace(b"</", b"<\\/")
+
+
 def generate_html_dashboard(data_dir: Path, reports_dir: Path):
     """Generate HTML dashboard for GitHub Pages."""
     portfolio_file = data_dir / "chatgpt_portfolio_update.csv"
     trade_log_file = data_dir / "chatgpt_trade_log.csv"
     
-    # Load data
+    # Load data; the page only shows the most recent rows
     portfolio_data = []
     trade_data = []
+    total_trades = 0
     
-    if portfolio_file.exists():
+    try:
         portfolio_df = pd.read_csv(portfolio_file)
-        portfolio_data = portfolio_df.to_dict('records')
+    except FileNotFoundError:
+        pass
+    else:
+        portfolio_data = _tail_records(portfolio_df, 20)
     
-    if trade_log_file.exists():
+    try:
         trade_df = pd.read_csv(trade_log_file)
-        trade_data = trade_df.to_dict('records')
-    
-    # Generate HTML
-    html_content = f"""
-<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ChatGPT Micro-Cap Trading Experiment</title>
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            margin: 0;
-            padding: 20px;
-            background-color: #f5f5f5;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        h1 {{
-            color: #2E8B57;
-            text-align: center;
-            margin-bottom: 30px;
-        }}
-        .chart-container {{
-            text-align: center;
-            margin: 30px 0;
-        }}
-        .chart-container img {{
-            max-width: 100%;
-            height: auto;
-            border: 1px solid #ddd;
-            border-radius: 8px;
-        }}
-        .stats {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin: 30px 0;
-        }}
-        .stat-card {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 8px;
-            text-align: center;
-        }}
-        .stat-value {{
-            font-size: 2em;
-            font-weight: bold;
-            color: #2E8B57;
-        }}
-        .stat-label {{
-            color: #666;
-            margin-top: 5px;
-        }}
-        .section {{
-            margin: 40px 0;
-        }}
-        .section h2 {{
-            color: #333;
-            border-bottom: 2px solid #2E8B57;
-            padding-bottom: 10px;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            margin-top: 20px;
-        }}
-        th, td {{
-            padding: 10px;
-            text-align: left;
-            border-bottom: 1px solid #ddd;
-        }}
-        th {{
-            background-color: #f8f9fa;
-            font-weight: bold;
-        }}
-        .footer {{
-            text-align: center;
-            margin-top: 50px;
-            color: #666;
-            font-size: 0.9em;
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <h1>🤖 ChatGPT Micro-Cap Trading Experiment</h1>
-        
-        <div class="chart-container">
-            <h2>Portfolio Performance</h2>
-            <img src="performance_chart.png" alt="Portfolio Performance Chart">
-        </div>
-        
-        <div class="stats">
-            <div class="stat-card">
-                <div class="stat-value" id="total-equity">--</div>
-                <div class="stat-label">Total Equity</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value" id="total-trades">{len(trade_data)}</div>
-                <div class="stat-label">Total Trades</div>
-            </div>
-            <div class="stat-card">
-                <div class="stat-value" id="last-updated">{datetime.now().strftime('%Y-%m-%d')}</div>
-                <div class="stat-label">Last Updated</div>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>📊 Recent Portfolio Data</h2>
-            <div style="overflow-x: auto;">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Date</th>
-                            <th>Ticker</th>
-                            <th>Shares</th>
-                            <th>Current Price</th>
-                            <th>Total Value</th>
-                            <th>P&L</th>
-                        </tr>
-                    </thead>
-                    <tbody id="portfolio-table">
-                        <!-- Portfolio data will be inserted here -->
-                    </tbody>
-                </table>
-            </div>
-        </div>
-        
-        <div class="section">
-            <h2>📈 Recent Trades</h2>
-            <div style="overflow-x: auto;">
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Date</th>
-                            <th>Ticker</th>
-                            <th>Action</th>
-                            <th>Shares</th>
-                            <th>Price</th>
-                            <th>P&L</th>
-                        </tr>
-                    </thead>
-                    <tbody id="trades-table">
-                        <!-- Trade data will be inserted here -->
-                    </tbody>
-                </table>
-            </div>
-        </div>
-        
-        <div class="footer">
-            <p>🚀 Automated trading experiment powered by ChatGPT</p>
-            <p>Data updated automatically via GitHub Actions</p>
-        </div>
-    </div>
-    
-    <script>
-        // Portfolio data
-        const portfolioData = JSON.parse("{html.escape(json.dumps(portfolio_data[-20:] if portfolio_data else []), quote=True)}");
-        const tradeData = JSON.parse("{html.escape(json.dumps(trade_data[-10:] if trade_data else []), quote=True)}");
-        
-        // Update total equity
-        if (portfolioData.length > 0) {{
-            const totalRows = portfolioData.filter(row => row.Ticker === 'TOTAL');
-            if (totalRows.length > 0) {{
-                const latestTotal = totalRows[totalRows.length - 1];
-                document.getElementById('total-equity').textContent = '$' + latestTotal['Total Equity'];
-            }}
-        }}
-        
-        // Populate portfolio table
-        const portfolioTable = document.getElementById('portfolio-table');
-        portfolioData.slice(-10).forEach(row => {{
-            if (row.Ticker !== 'TOTAL') {{
-                const tr = document.createElement('tr');
-                tr.innerHTML = `
-                    <td>${{row.Date}}</td>
-                    <td>${{row.Ticker}}</td>
-                    <td>${{row.Shares || '--'}}</td>
-                    <td>${{row['Current Price'] ? '$' + row['Current Price'] : '--'}}</td>
-                    <td>${{row['Total Value'] ? '$' + row['Total Value'] : '--'}}</td>
-                    <td style="color: ${{(row.PnL || 0) >= 0 ? '#2E8B57' : '#dc3545'}}">${{row.PnL ? '$' + row.PnL : '--'}}</td>
-                `;
-                portfolioTable.appendChild(tr);
-            }}
-        }});
-        
-        // Populate trades table
-        const tradesTable = document.getElementById('trades-table');
-        tradeData.forEach(row => {{
-            const tr = document.createElement('tr');
-            tr.innerHTML = `
-                <td>${{row.date}}</td>
-                <td>${{row.ticker}}</td>
-                <td>${{row.action}}</td>
-                <td>${{row.shares}}</td>
-                <td>${{row.price ? '$' + row.price : '--'}}</td>
-                <td style="color: ${{(row.pnl || 0) >= 0 ? '#2E8B57' : '#dc3545'}}">${{row.pnl ? '$' + row.pnl : '--'}}</td>
-            `;
-            tradesTable.appendChild(tr);
-        }});
-    </script>
-</body>
-</html>
-"""
-    
-    # Save HTML file
+    except FileNotFoundError:
+        pass
+    else:
+        trade_data = _tail_records(trade_df, 10)
+        total_trades = len(trade_df)
+    
+    fields = {
+        b"PORTFOLIO_JSON": _script_json(portfolio_data),
+        b"TRADES_JSON": _script_json(trade_data),
+        b"TOTAL_TRADES": str(total_trades).encode(),
+        b"LAST_UPDATED": datetime.now().strftime('%Y-%m-%d').encode(),
+    }
+    
+    # Stream template pieces and payloads straight to disk; re.split with a
+    # capture group alternates literal chunks and sentinel names
     html_path = reports_dir / "index.html"
-    html_path.write_text(html_content)
+    parts = _TEMPLATE_FIELD.split(REPORT_TEMPLATE.read_bytes())
+    with open(html_path, 'wb') as f:
+        for i, part in enumerate(parts):
+            f.write(fields[part] if i % 2 else part)
     
     print(f"✅ HTML dashboard saved to {html_path}")
 
@@ -1,10 +1,18 @@
-"""Data fetching utilities for market data."""
+"""Data fetching utilities for market data.
 
-import yfinance as yf
-import pandas as pd
-from typing import Dict, List, Optional
-import requests
+yfinance (which pulls in pandas, numpy and an HTTP stack) and requests are
+imported inside the methods that use them, so importing this module or
+constructing a ``DataFetcher`` stays cheap.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, List, Optional
 import os
+import time
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class DataFetcher:
@@ -12,8 +20,29 @@ class DataFetcher:
     
     def __init__(self):
         self.alpha_vantage_key = os.getenv('ALPHA_VANTAGE_API_KEY')
+        # Created on first Alpha Vantage call; see _get_session
+        self._session = None
+        # Quotes are memoized per (ticker, minute) to absorb refresh bursts
+        # under the free tier's 5 requests/minute limit
+        self._alpha_vantage_quote = lru_cache(maxsize=64)(self._fetch_alpha_vantage_quote)
+    
+    def _get_session(self):
+        """Return the shared keep-alive session for Alpha Vantage calls."""
+        if self._session is None:
+            import requests
+            from requests.adapters import HTTPAdapter
+            from urllib3.util.retry import Retry
+            
+            session = requests.Session()
+            session.mount('https://', HTTPAdapter(
+                pool_connections=4,
+                pool_maxsize=8,
+                max_retries=Retry(total=2, backoff_factor=0.3),
+            ))
+            self._session = session
+        return self._session
     
-    def get_stock_data(self, ticker: str, period: str = "1d") -> Optional[pd.DataFrame]:
+    def get_stock_data(self, ticker: str, period: str = "1d") -> Optional["pd.DataFrame"]:
         """
         Fetch stock data using yfinance.
         
@@ -25,6 +54,8 @@ class DataFetcher:
             DataFrame with stock data or None if error
         """
         try:
+            import yfinance as yf
+            
             stock = yf.Ticker(ticker)
             data = stock.history(period=period)
             return data
@@ -43,6 +74,8 @@ class DataFetcher:
             Current price or None if error
         """
         try:
+            import yfinance as yf
+            
             stock = yf.Ticker(ticker)
             data = stock.history(period="1d")
             if not data.empty:
@@ -62,13 +95,63 @@ class DataFetcher:
         Returns:
             Dictionary mapping ticker to current price
         """
+        symbols = list(dict.fromkeys(tickers))
+        if not symbols:
+            return {}
+        
+        prices = self._get_prices_batched(symbols)
+        # yf.download reports failed symbols by leaving them out (or by
+        # returning an empty frame) rather than raising, so anything the
+        # batch did not price is retried one by one
+        missing = [ticker for ticker in symbols if ticker not in prices]
+        if missing:
+            prices.update(self._get_prices_individually(missing))
+        return prices
+    
+    def _get_prices_batched(self, symbols: List[str]) -> Dict[str, float]:
+        """Price every symbol with one batched yf.download call."""
+        try:
+            import pandas as pd
+            import yfinance as yf
+            
+            data = yf.download(
+                tickers=symbols,
+                period="1d",
+                group_by="ticker",
+                auto_adjust=True,
+                progress=False,
+                threads=True,
+            )
+        except Exception as e:
+            print(f"Error batch fetching prices: {e}")
+            return {}
+        
         prices = {}
-        for ticker in tickers:
-            price = self.get_current_price(ticker)
-            if price is not None:
-                prices[ticker] = price
+        if data is None or data.empty:
+            return prices
+        
+        for ticker in symbols:
+            try:
+                if isinstance(data.columns, pd.MultiIndex):
+                    closes = data[ticker]['Close']
+                else:
+                    closes = data['Close']
+            except KeyError:
+                continue
+            closes = closes.dropna()
+            if not closes.empty:
+                prices[ticker] = float(closes.iloc[-1])
         return prices
     
+    def _get_prices_individually(self, tickers: List[str]) -> Dict[str, float]:
+        """Fetch prices per ticker, concurrently, for symbols the batch missed."""
+        if not tickers:
+            return {}
+        # The lookups are network-bound, so threads overlap their round trips
+        with ThreadPoolExecutor(max_workers=min(16, len(tickers))) as executor:
+            results = zip(tickers, executor.map(self.get_current_price, tickers))
+            return {ticker: price for ticker, price in results if price is not None}
+    
     def get_market_data_alpha_vantage(self, ticker: str) -> Optional[Dict]:
         """
         Fetch data using Alpha Vantage API (backup/alternative source).
@@ -84,27 +167,35 @@ class DataFetcher:
             return None
         
         try:
-            url = f"https://www.alphavantage.co/query"
-            params = {
-                'function': 'GLOBAL_QUOTE',
-                'symbol': ticker,
-                'apikey': self.alpha_vantage_key
-            }
-            
-            response = requests.get(url, params=params)
-            data = response.json()
-            
-            if 'Global Quote' in data:
-                quote = data['Global Quote']
-                return {
-                    'symbol': quote.get('01. symbol'),
-                    'price': float(quote.get('05. price', 0)),
-                    'change': float(quote.get('09. change', 0)),
-                    'change_percent': quote.get('10. change percent'),
-                }
-            
-            return None
-            
+            return self._alpha_vantage_quote(ticker, int(time.time() // 60))
         except Exception as e:
             print(f"Error fetching Alpha Vantage data for {ticker}: {e}")
-            return None
\ No newline at end of file
+            return None
+    
+    def _fetch_alpha_vantage_quote(self, ticker: str, minute: int) -> Optional[Dict]:
+        """
+        Request a GLOBAL_QUOTE from Alpha Vantage.
+        
+        ``minute`` only keys the memoization; errors propagate so they are
+        never cached.
+        """
+        url = "https://www.alphavantage.co/query"
+        params = {
+            'function': 'GLOBAL_QUOTE',
+            'symbol': ticker,
+            'apikey': self.alpha_vantage_key
+        }
+        
+        response = self._get_session().get(url, params=params, timeout=5)
+        data = response.json()
+        
+        if 'Global Quote' in data:
+            quote = data['Global Quote']
+            return {
+                'symbol': quote.get('01. symbol'),
+                'price': float(quote.get('05. price', 0)),
+                'change': float(quote.get('09. change', 0)),
+                'change_percent': quote.get('10. change percent'),
+            }
+        
+        return None
\ No newline at end of file
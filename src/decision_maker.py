@@ -1,43 +1,39 @@
 """Decision making engine using ChatGPT API."""
 
+import asyncio
+import hashlib
 import os
+import queue
+import re
+import sqlite3
+import sys
+import time
+from contextlib import closing
+from dataclasses import asdict, dataclass, field
+from functools import lru_cache
+import httpx
 import openai
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional, Tuple, Union
 import json
+import logging
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class DecisionMaker:
-    """Handles automated trading decisions using ChatGPT API."""
-    
-    def __init__(self):
-        self.api_key = os.getenv('OPENAI_API_KEY')
-        if self.api_key:
-            self.client = openai.OpenAI(api_key=self.api_key)
-        else:
-            self.client = None
-            print("Warning: OpenAI API key not configured")
-    
-    def generate_trading_prompt(self, portfolio_data: Dict, market_data: Dict) -> str:
-        """
-        Generate a trading prompt for ChatGPT.
-        
-        Args:
-            portfolio_data: Current portfolio information
-            market_data: Current market data
-        
-        Returns:
-            Formatted prompt string
-        """
-        prompt = f"""
-You are managing a micro-cap stock portfolio with the following current holdings:
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-PORTFOLIO SUMMARY:
-{json.dumps(portfolio_data, indent=2)}
+# Static instructions are sent as the system message, ahead of any
+# per-call data, so the prompt prefix stays byte-identical between calls and
+# qualifies for the API's automatic prompt caching.
+_SYSTEM_PROMPT = """You are a conservative micro-cap stock trading advisor.
 
-CURRENT MARKET DATA:
-{json.dumps(market_data, indent=2)}
-
-Based on this information, please analyze the portfolio and provide trading recommendations.
+You are managing a micro-cap stock portfolio. Each request gives you the
+current holdings (PORTFOLIO SUMMARY) and current market data (CURRENT MARKET
+DATA). Based on this information, analyze the portfolio and provide trading
+recommendations.
 
 Consider:
 1. Current positions and their performance
@@ -58,7 +54,254 @@ ANALYSIS:
 
 Remember: This is real money trading, so be conservative and follow strict risk management.
 """
-        return prompt
+
+# Decisions for an identical portfolio/market snapshot are reused for this
+# many seconds instead of issuing another API request.
+DECISION_CACHE_TTL = 15 * 60
+
+# Connection pool for the OpenAI client. Keeping connections alive between
+# calls skips the TCP/TLS handshake on every request after the first.
+HTTP_LIMITS = httpx.Limits(
+    max_keepalive_connections=10,
+    max_connections=20,
+    keepalive_expiry=30.0,
+)
+HTTP_TIMEOUT = 60.0
+
+# Action lines in the ACTIONS section of a response, one pattern per verb.
+# Reasons stop at the end of the line ([ \t] rather than \s) so a line with
+# no reason never swallows the next one; surrounding blanks fall outside the
+# group, so the captured reason needs no further stripping.
+_REASON = r':?[ \t]*(?P<reason>[^\r\n]*?)[ \t]*(?=[\r\n]|\Z)'
+_HOLD_RE = re.compile(
+    r'^[ \t]*- HOLD[ \t]+(?P<ticker>[^\s:]+)' + _REASON,
+    re.M,
+)
+_SELL_RE = re.compile(
+    r'^[ \t]*- SELL[ \t]+(?P<ticker>[^\s:]+)[ \t]+(?P<shares>\d+)'
+    r'[ \t]+at[ \t]+\$?(?P<price>\d+(?:\.\d+)?)' + _REASON,
+    re.M,
+)
+_BUY_RE = re.compile(
+    r'^[ \t]*- BUY[ \t]+(?P<ticker>[^\s:]+)[ \t]+(?P<shares>\d+)'
+    r'[ \t]+at[ \t]+\$?(?P<max_price>\d+(?:\.\d+)?)'
+    r'[ \t]+stop_loss[ \t]+\$?(?P<stop_loss>\d+(?:\.\d+)?)' + _REASON,
+    re.M,
+)
+
+
+@dataclass(slots=True)
+class HoldAction:
+    """Format: - HOLD [ticker]: Reason"""
+    action: str = field(default="HOLD", init=False)
+    ticker: str
+    reason: str = ""
+
+    @classmethod
+    def from_match(cls, m: re.Match) -> "HoldAction":
+        return cls(m['ticker'], m['reason'])
+
+
+@dataclass(slots=True)
+class SellAction:
+    """Format: - SELL [ticker] [shares] at [price]: Reason"""
+    action: str = field(default="SELL", init=False)
+    ticker: str
+    shares: int
+    price: float
+    reason: str = ""
+
+    @classmethod
+    def from_match(cls, m: re.Match) -> "SellAction":
+        return cls(m['ticker'], int(m['shares']), float(m['price']), m['reason'])
+
+
+@dataclass(slots=True)
+class BuyAction:
+    """Format: - BUY [ticker] [shares] at [max_price] stop_loss [price]: Reason"""
+    action: str = field(default="BUY", init=False)
+    ticker: str
+    shares: int
+    max_price: float
+    stop_loss: float
+    reason: str = ""
+
+    @classmethod
+    def from_match(cls, m: re.Match) -> "BuyAction":
+        return cls(m['ticker'], int(m['shares']), float(m['max_price']),
+                   float(m['stop_loss']), m['reason'])
+
+
+Action = Union[HoldAction, SellAction, BuyAction]
+
+_ACTION_PATTERNS = (
+    (_HOLD_RE, HoldAction.from_match),
+    (_SELL_RE, SellAction.from_match),
+    (_BUY_RE, BuyAction.from_match),
+)
+
+_ACTION_TYPES = {"HOLD": HoldAction, "SELL": SellAction, "BUY": BuyAction}
+
+
+def _parse_line(line: str) -> Optional[Action]:
+    """Parse a single response line into an action, or None."""
+    for pattern, build in _ACTION_PATTERNS:
+        m = pattern.match(line)
+        if m:
+            return build(m)
+    return None
+
+
+def _action_from_dict(data: Dict) -> Action:
+    """Rebuild an action from its serialized form."""
+    fields = dict(data)
+    return _ACTION_TYPES[fields.pop("action")](**fields)
+
+
+def _dumps(obj, indent: bool = False, sort_keys: bool = False) -> bytes:
+    """Serialize ``obj`` to UTF-8 JSON bytes, preferring orjson."""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        if sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None, sort_keys=sort_keys,
+                      default=asdict).encode()
+
+
+def _loads(data: bytes):
+    """Parse JSON bytes, preferring orjson."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _snapshot(portfolio_data: Dict, market_data: Dict) -> Tuple[bytes, bytes]:
+    """
+    Serialize a portfolio/market snapshot once per call.
+    
+    The same bytes feed both the cache key and the prompt; sorted keys make
+    equal snapshots serialize identically. The JSON is compact, since the
+    model does not need indentation and whitespace costs prompt tokens.
+    """
+    return (
+        _dumps(portfolio_data, sort_keys=True),
+        _dumps(market_data, sort_keys=True),
+    )
+
+
+@lru_cache(maxsize=8)
+def _render_prompt(portfolio_json: bytes, market_json: bytes) -> str:
+    """Build the user message from a serialized snapshot."""
+    return f"""PORTFOLIO SUMMARY:
+{portfolio_json.decode()}
+
+CURRENT MARKET DATA:
+{market_json.decode()}
+"""
+
+
+def iter_decisions(log_file: str = "decision_log.jsonl") -> Iterator[Dict]:
+    """
+    Stream logged decisions from a JSON Lines decision log.
+    
+    Args:
+        log_file: Path to the log written by ``DecisionMaker.log_decision``
+    
+    Yields:
+        One decision dictionary per logged line, oldest first
+    """
+    with open(log_file, 'rb') as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
+
+
+def pretty_print_log(log_file: str = "decision_log.jsonl", out=None):
+    """
+    Write a JSON Lines decision log as indented JSON for human reading.
+    
+    Args:
+        log_file: Path to the log written by ``DecisionMaker.log_decision``
+        out: Binary stream to write to; defaults to stdout
+    """
+    out = out if out is not None else sys.stdout.buffer
+    for decision in iter_decisions(log_file):
+        out.write(_dumps(decision, indent=True) + b'\n')
+
+
+class DecisionMaker:
+    """Handles automated trading decisions using ChatGPT API."""
+    
+    def __init__(self, cache_file: Optional[str] = "decision_cache.sqlite3"):
+        """
+        Args:
+            cache_file: SQLite file for cached decisions, or None to disable
+                the cache
+        """
+        self.cache_file = cache_file
+        self.api_key = os.getenv('OPENAI_API_KEY')
+        if self.api_key:
+            self.client = openai.OpenAI(
+                api_key=self.api_key,
+                http_client=httpx.Client(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+            )
+        else:
+            self.client = None
+            logger.warning("OpenAI API key not configured")
+        # Async connections belong to the event loop that opened them, so
+        # the async client is created lazily and tied to that loop
+        self._async_client = None
+        self._async_loop = None
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
+    
+    def close(self):
+        """Close the pooled HTTP connections."""
+        if self.client is not None:
+            self.client.close()
+        loop, client = self._async_loop, self._async_client
+        self._async_client = self._async_loop = None
+        if client is not None and not loop.is_closed() and not loop.is_running():
+            loop.run_until_complete(client.close())
+    
+    async def aclose(self):
+        """Close the pooled HTTP connections from inside an event loop."""
+        if self._async_client is not None:
+            client, loop = self._async_client, self._async_loop
+            self._async_client = self._async_loop = None
+            if loop is asyncio.get_running_loop():
+                await client.close()
+        if self.client is not None:
+            self.client.close()
+    
+    def generate_trading_prompt(self, portfolio_data: Dict, market_data: Dict) -> str:
+        """
+        Generate the user message for ChatGPT.
+        
+        Only the per-call data goes here; the fixed instructions live in
+        ``_SYSTEM_PROMPT`` so they form a stable, cacheable prefix.
+        
+        Args:
+            portfolio_data: Current portfolio information
+            market_data: Current market data
+        
+        Returns:
+            Formatted prompt string
+        """
+        return _render_prompt(*_snapshot(portfolio_data, market_data))
     
     def get_trading_decision(self, portfolio_data: Dict, market_data: Dict) -> Optional[Dict]:
         """
@@ -72,38 +315,290 @@ Remember: This is real money trading, so be conservative and follow strict risk
             Trading decision dictionary or None if error
         """
         if not self.client:
-            print("Cannot make automated decisions: OpenAI API key not configured")
+            logger.error("Cannot make automated decisions: OpenAI API key not configured")
             return None
         
         try:
-            prompt = self.generate_trading_prompt(portfolio_data, market_data)
+            snapshot = _snapshot(portfolio_data, market_data)
+            cache_key = self._cache_key(*snapshot)
+            cached = self._cached_decision(cache_key)
+            if cached is not None:
+                return cached
             
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a conservative micro-cap stock trading advisor."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1000,
-                temperature=0.7
-            )
-            
-            decision_text = response.choices[0].message.content
+            prompt = _render_prompt(*snapshot)
+            response = self.client.chat.completions.create(**self._request(prompt))
+            return self._build_decision(cache_key, response)
             
-            # Parse the response into structured decision data
-            decision = {
-                "raw_response": decision_text,
-                "timestamp": os.environ.get('GITHUB_RUN_ID', 'manual'),
-                "actions": self._parse_actions(decision_text)
-            }
+        except Exception:
+            logger.exception("Error getting ChatGPT decision")
+            return None
+    
+    async def get_trading_decision_async(self, portfolio_data: Dict,
+                                         market_data: Dict) -> Optional[Dict]:
+        """
+        Async variant of ``get_trading_decision``.
+        
+        Connections are pooled per event loop; use ``async with`` or
+        ``await aclose()`` before the loop ends to release them.
+        
+        Args:
+            portfolio_data: Current portfolio information
+            market_data: Current market data
+        
+        Returns:
+            Trading decision dictionary or None if error
+        """
+        if not self.api_key:
+            logger.error("Cannot make automated decisions: OpenAI API key not configured")
+            return None
+        
+        return await self._decide_async(self._get_async_client(), portfolio_data, market_data)
+    
+    async def get_decisions_batch(
+        self, snapshots: List[Tuple[Dict, Dict]]
+    ) -> List[Optional[Dict]]:
+        """
+        Get decisions for several (portfolio_data, market_data) snapshots
+        concurrently, so the batch takes about as long as its slowest call.
+        
+        The batch opens its own connection pool and closes it when done, so
+        repeated ``asyncio.run(...)`` calls never reuse a closed loop.
+        
+        Args:
+            snapshots: List of (portfolio_data, market_data) pairs
+        
+        Returns:
+            One decision (or None on error) per snapshot, in input order
+        """
+        if not self.api_key:
+            logger.error("Cannot make automated decisions: OpenAI API key not configured")
+            return [None] * len(snapshots)
+        
+        async with self._new_async_client() as client:
+            return await asyncio.gather(
+                *(self._decide_async(client, portfolio_data, market_data)
+                  for portfolio_data, market_data in snapshots)
+            )
+    
+    def _new_async_client(self) -> openai.AsyncOpenAI:
+        return openai.AsyncOpenAI(
+            api_key=self.api_key,
+            http_client=httpx.AsyncClient(limits=HTTP_LIMITS, timeout=HTTP_TIMEOUT),
+        )
+    
+    def _get_async_client(self) -> openai.AsyncOpenAI:
+        """Return the async client for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._async_client is None or self._async_loop is not loop:
+            # A client from an earlier, now finished loop cannot be reused
+            self._async_client = self._new_async_client()
+            self._async_loop = loop
+        return self._async_client
+    
+    async def _decide_async(self, client: openai.AsyncOpenAI, portfolio_data: Dict,
+                            market_data: Dict) -> Optional[Dict]:
+        try:
+            snapshot = _snapshot(portfolio_data, market_data)
+            cache_key = self._cache_key(*snapshot)
+            cached = self._cached_decision(cache_key)
+            if cached is not None:
+                return cached
             
-            return decision
+            prompt = _render_prompt(*snapshot)
+            response = await client.chat.completions.create(**self._request(prompt))
+            return self._build_decision(cache_key, response)
             
+        except Exception:
+            logger.exception("Error getting ChatGPT decision")
+            return None
+    
+    def stream_trading_decision(
+        self,
+        portfolio_data: Dict,
+        market_data: Dict,
+        actions: Optional[queue.Queue] = None,
+    ) -> Optional[Dict]:
+        """
+        Get a trading decision, parsing actions while the response streams in.
+        
+        Each action is put on ``actions`` as soon as its line is complete, so
+        a consumer in another thread can start acting before generation
+        finishes. Cached decisions are replayed onto the queue the same way.
+        
+        After the last action exactly one terminal item is put on the queue:
+        ``None`` when the decision completed, or the exception that stopped
+        it. Actions already queued before an exception came from a partial
+        response. A consumer reads until the terminal item::
+        
+            for item in iter(actions.get, None):
+                if isinstance(item, Exception):
+                    break  # generation failed part-way
+                act_on(item)
+        
+        Args:
+            portfolio_data: Current portfolio information
+            market_data: Current market data
+            actions: Optional queue that receives each parsed action,
+                followed by the terminal item
+        
+        Returns:
+            Trading decision dictionary or None if error
+        """
+        outcome = None
+        try:
+            return self._stream_decision(portfolio_data, market_data, actions)
         except Exception as e:
-            print(f"Error getting ChatGPT decision: {e}")
+            outcome = e
+            logger.exception("Error getting ChatGPT decision")
             return None
+        finally:
+            if actions is not None:
+                actions.put(outcome)
+    
+    def _stream_decision(self, portfolio_data: Dict, market_data: Dict,
+                         actions: Optional[queue.Queue]) -> Dict:
+        """Body of ``stream_trading_decision``; errors propagate to it."""
+        if not self.client:
+            raise RuntimeError("Cannot make automated decisions: OpenAI API key not configured")
+        
+        snapshot = _snapshot(portfolio_data, market_data)
+        cache_key = self._cache_key(*snapshot)
+        cached = self._cached_decision(cache_key)
+        if cached is not None:
+            if actions is not None:
+                for action in cached["actions"]:
+                    actions.put(action)
+            return cached
+        
+        prompt = _render_prompt(*snapshot)
+        stream = self.client.chat.completions.create(
+            **self._request(prompt), stream=True
+        )
+        
+        parts = []
+        parsed = []
+        pending = ""
+        # Same rule as _parse_actions: stop at the line holding the
+        # ANALYSIS header that follows the ACTIONS header; the rest of
+        # the text is still collected
+        seen_actions = False
+        parsing = True
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if not delta:
+                continue
+            parts.append(delta)
+            if not parsing:
+                continue
+            pending += delta
+            while parsing and "\n" in pending:
+                line, _, pending = pending.partition("\n")
+                seen_actions = seen_actions or 'ACTIONS:' in line
+                if seen_actions and 'ANALYSIS:' in line:
+                    parsing = False
+                else:
+                    self._emit_line(line, parsed, actions)
+        if parsing:
+            self._emit_line(pending, parsed, actions)
+        
+        decision = {
+            "raw_response": "".join(parts),
+            "timestamp": os.environ.get('GITHUB_RUN_ID', 'manual'),
+            "actions": parsed
+        }
+        self._cache_put(cache_key, decision)
+        return decision
+    
+    @staticmethod
+    def _emit_line(line: str, parsed: List[Action], actions: Optional[queue.Queue]):
+        """Parse one complete response line and publish any action found."""
+        action = _parse_line(line)
+        if action is not None:
+            parsed.append(action)
+            if actions is not None:
+                actions.put(action)
+    
+    @staticmethod
+    def _request(prompt: str) -> Dict:
+        """Keyword arguments for a chat completion request."""
+        return {
+            "model": "gpt-4",
+            "messages": [
+                {"role": "system", "content": _SYSTEM_PROMPT},
+                {"role": "user", "content": prompt}
+            ],
+            "max_tokens": 1000,
+            "temperature": 0.7,
+        }
+    
+    def _cached_decision(self, cache_key: str) -> Optional[Dict]:
+        """Return a cached decision stamped with the current run, if any."""
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            cached["timestamp"] = os.environ.get('GITHUB_RUN_ID', 'manual')
+        return cached
+    
+    def _build_decision(self, cache_key: str, response) -> Dict:
+        """Turn a chat completion into a decision and cache it."""
+        decision_text = response.choices[0].message.content
+        
+        # Parse the response into structured decision data
+        decision = {
+            "raw_response": decision_text,
+            "timestamp": os.environ.get('GITHUB_RUN_ID', 'manual'),
+            "actions": self._parse_actions(decision_text)
+        }
+        
+        self._cache_put(cache_key, decision)
+        return decision
     
-    def _parse_actions(self, response_text: str) -> List[Dict]:
+    @staticmethod
+    def _cache_key(portfolio_json: bytes, market_json: bytes) -> str:
+        """Hash a serialized snapshot from ``_snapshot``."""
+        digest = hashlib.blake2b(digest_size=16)
+        digest.update(portfolio_json)
+        digest.update(b'\0')
+        digest.update(market_json)
+        return digest.hexdigest()
+    
+    def _cache_get(self, key: str) -> Optional[Dict]:
+        """Return a cached decision younger than DECISION_CACHE_TTL, if any."""
+        if not self.cache_file:
+            return None
+        try:
+            with closing(sqlite3.connect(self.cache_file)) as conn:
+                row = conn.execute(
+                    "SELECT created, decision FROM decisions WHERE key = ?", (key,)
+                ).fetchone()
+        except sqlite3.Error:
+            # Missing table or unreadable file: behave like a cache miss
+            return None
+        if row is None or time.time() - row[0] > DECISION_CACHE_TTL:
+            return None
+        decision = _loads(row[1])
+        decision["actions"] = [_action_from_dict(a) for a in decision["actions"]]
+        return decision
+    
+    def _cache_put(self, key: str, decision: Dict):
+        """Store a decision under ``key``; cache failures are never fatal."""
+        if not self.cache_file:
+            return
+        try:
+            with closing(sqlite3.connect(self.cache_file)) as conn, conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS decisions "
+                    "(key TEXT PRIMARY KEY, created REAL, decision BLOB)"
+                )
+                conn.execute(
+                    "INSERT OR REPLACE INTO decisions VALUES (?, ?, ?)",
+                    (key, time.time(), _dumps(decision)),
+                )
+        except sqlite3.Error as e:
+            logger.warning("Error caching decision: %s", e)
+    
+    def _parse_actions(self, response_text: str) -> List[Action]:
         """
         Parse trading actions from ChatGPT response.
         
@@ -113,80 +608,50 @@ Remember: This is real money trading, so be conservative and follow strict risk
         Returns:
             List of parsed actions
         """
-        # Extract trading actions from structured response text
-        actions = []
-        lines = response_text.split('\n')
-        
-        for line in lines:
-            line = line.strip()
-            if line.startswith('- HOLD'):
-                # Parse HOLD action
-                parts = line.split()
-                if len(parts) >= 2:
-                    ticker = parts[1].rstrip(':')
-                    actions.append({
-                        "action": "HOLD",
-                        "ticker": ticker,
-                        "reason": " ".join(parts[2:])
-                    })
-            
-            elif line.startswith('- SELL'):
-                # Parse SELL action
-                # Format: - SELL [ticker] [shares] at [price]: Reason
-                parts = line.split()
-                if len(parts) >= 5:
-                    try:
-                        actions.append({
-                            "action": "SELL",
-                            "ticker": parts[1],
-                            "shares": int(parts[2]),
-                            "price": float(parts[4]),
-                            "reason": " ".join(parts[5:])
-                        })
-                    except (ValueError, IndexError):
-                        continue
-            
-            elif line.startswith('- BUY'):
-                # Parse BUY action
-                # Format: - BUY [ticker] [shares] at [max_price] stop_loss [price]: Reason
-                parts = line.split()
-                if len(parts) >= 7:
-                    try:
-                        actions.append({
-                            "action": "BUY",
-                            "ticker": parts[1],
-                            "shares": int(parts[2]),
-                            "max_price": float(parts[4]),
-                            "stop_loss": float(parts[6]),
-                            "reason": " ".join(parts[7:])
-                        })
-                    except (ValueError, IndexError):
-                        continue
-        
-        return actions
-    
-    def log_decision(self, decision: Dict, log_file: str = "decision_log.json"):
-        """
-        Log trading decision to file.
+        # Every action line contains "- "; replies without one (analysis
+        # only) need no regex work at all
+        if '- ' not in response_text:
+            return []
+        
+        # Stop at the line holding the ANALYSIS header that follows the
+        # ACTIONS header. Text before ACTIONS is kept: a streamed reply
+        # cannot know a header is coming, and both parsers share one rule.
+        start = response_text.find('ACTIONS:')
+        if start != -1:
+            line_start = response_text.rfind('\n', 0, start) + 1
+            end = response_text.find('ANALYSIS:', line_start)
+            if end != -1:
+                response_text = response_text[:response_text.rfind('\n', 0, end) + 1]
+        
+        # Each pattern scans the text in C; matches are then put back into
+        # the order they appear in the response
+        matches = [
+            (m.start(), build(m))
+            for pattern, build in _ACTION_PATTERNS
+            for m in pattern.finditer(response_text)
+        ]
+        matches.sort(key=lambda item: item[0])
+        return [action for _, action in matches]
+    
+    def log_decision(self, decision: Dict, log_file: str = "decision_log.jsonl"):
+        """
+        Append a trading decision to a JSON Lines log file.
+        
+        Each decision is one line, so logging never rereads or rewrites
+        earlier entries. Use ``iter_decisions`` to read the log back, or
+        ``python -m src.decision_maker [log_file]`` to pretty-print it.
         
         Args:
             decision: Decision dictionary to log
             log_file: Path to log file
         """
         try:
-            # Load existing log
-            if os.path.exists(log_file):
-                with open(log_file, 'r') as f:
-                    log_data = json.load(f)
-            else:
-                log_data = []
-            
-            # Add new decision
-            log_data.append(decision)
-            
-            # Save updated log
-            with open(log_file, 'w') as f:
-                json.dump(log_data, f, indent=2)
+            with open(log_file, 'ab') as f:
+                f.write(_dumps(decision) + b'\n')
                 
-        except Exception as e:
-            print(f"Error logging decision: {e}")
\ No newline at end of file
+        except Exception:
+            logger.exception("Error logging decision")
+
+
+if __name__ == "__main__":
+    pretty_print_log(*sys.argv[1:2])
@@ -1,16 +1,25 @@
-"""Trading engine for automated operations."""
+"""Trading engine for automated operations.
 
+Run from the project root as ``python -m src.trading_engine``.
+"""
+
+import importlib.util
+import logging
 import sys
 import os
 from pathlib import Path
-import pandas as pd
 
-# Add the project root to the Python path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(project_root))
+import numpy as np
 
 from trading_script import process_portfolio, load_latest_portfolio_state, set_data_dir
 
+project_root = Path(__file__).resolve().parent.parent
+
+logger = logging.getLogger(__name__)
+
+# Use the multithreaded Arrow CSV reader when pyarrow is installed
+CSV_ENGINE = "pyarrow" if importlib.util.find_spec("pyarrow") else None
+
 
 def run_automated_trading():
     """Execute trading logic in automated mode."""
@@ -22,7 +31,9 @@ def run_automated_trading():
     portfolio_file = str(data_dir / "chatgpt_portfolio_update.csv")
     
     try:
-        chatgpt_portfolio, cash = load_latest_portfolio_state(portfolio_file)
+        chatgpt_portfolio, cash = load_latest_portfolio_state(
+            portfolio_file, engine=CSV_ENGINE
+        )
         
         # Process portfolio without user interaction
         chatgpt_portfolio, cash = process_portfolio(
@@ -31,15 +42,26 @@ def run_automated_trading():
             interactive=False
         )
         
-        print(f"✅ Trading engine completed. Portfolio value: ${cash + sum([row.get('cost_basis', 0) for _, row in chatgpt_portfolio.iterrows() if row.get('cost_basis', None) is not None and pd.notnull(row.get('cost_basis', None))]):.2f}")
+        # Pull the hot column out as a float64 array once, so valuation is a
+        # plain NumPy reduction; nansum skips missing cost bases
+        if "cost_basis" in chatgpt_portfolio:
+            cost_basis = chatgpt_portfolio["cost_basis"].to_numpy(dtype=np.float64)
+        else:
+            cost_basis = np.empty(0)
+        holdings_value = float(np.nansum(cost_basis))
+        logger.info("✅ Trading engine completed. Portfolio value: $%.2f", cash + holdings_value)
         
         return True
         
-    except Exception as e:
-        print(f"❌ Trading engine error: {e}")
+    except Exception:
+        logger.exception("❌ Trading engine error")
         return False
 
 
 if __name__ == "__main__":
+    logging.basicConfig(
+        level=os.environ.get("LOG_LEVEL", "INFO").upper(),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
     success = run_automated_trading()
     sys.exit(0 if success else 1)
\ No newline at end of file
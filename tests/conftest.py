@@ -0,0 +1,11 @@
+"""Shared test fixtures."""
+
+import pytest
+
+from src.data_fetcher import DataFetcher
+
+
+@pytest.fixture(scope="module")
+def fetcher():
+    """One DataFetcher shared by the tests of a module."""
+    return DataFetcher()
@@ -0,0 +1,143 @@
+"""Tests for the Flask dashboard and its cached API responses."""
+
+import json
+import os
+from types import SimpleNamespace
+
+import pandas as pd
+import pytest
+
+import app as app_module
+
+
+PORTFOLIO_CSV = """Date,Ticker,Shares,Buy Price,Cost Basis,Stop Loss,Current Price,Total Value,PnL,Action,Cash Balance,Total Equity
+2025-07-01,ABEO,6.0,5.77,34.62,4.9,5.68,34.08,-0.54,HOLD,,
+2025-07-01,TOTAL,,,,,,34.08,-0.54,,65.38,99.46
+2025-07-02,ABEO,6.0,5.77,34.62,4.9,5.90,35.40,0.78,HOLD,,
+2025-07-02,TOTAL,,,,,,35.40,0.78,,65.38,100.78
+"""
+
+TRADE_CSV = """Date,Ticker,Shares Bought,Buy Price,Cost Basis,PnL,Reason,Shares Sold,Sell Price
+2025-07-01,ABEO,6.0,5.77,34.62,0.0,MANUAL BUY - New position,,
+"""
+
+
+def _clear_caches():
+    app_module._read_csv_cached.cache_clear()
+    app_module._serialized.cache_clear()
+    app_module._file_flags.cache_clear()
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Point the app at CSV files in a temporary directory."""
+    (tmp_path / "chatgpt_portfolio_update.csv").write_text(PORTFOLIO_CSV)
+    (tmp_path / "chatgpt_trade_log.csv").write_text(TRADE_CSV)
+    monkeypatch.setattr(app_module, "project_root", tmp_path)
+    monkeypatch.setattr(app_module, "PORTFOLIO_FILE", tmp_path / "chatgpt_portfolio_update.csv")
+    monkeypatch.setattr(app_module, "TRADE_FILE", tmp_path / "chatgpt_trade_log.csv")
+    # Cache keys hold stat fields but not paths, so start every test clean
+    _clear_caches()
+    yield tmp_path
+    _clear_caches()
+
+
+@pytest.fixture
+def client(data_dir):
+    return app_module.app.test_client()
+
+
+def _rewrite(path, text):
+    """Rewrite ``path`` and move its mtime so the stat-keyed caches see it."""
+    mtime_ns = path.stat().st_mtime_ns
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns + 10**9, mtime_ns + 10**9))
+
+
+class TestApi:
+    """Test the cached JSON endpoints."""
+    
+    def test_portfolio_etag_and_not_modified(self, client):
+        """Test that a matching If-None-Match gets an empty 304."""
+        response = client.get("/api/portfolio")
+        assert response.status_code == 200
+        assert response.cache_control.max_age == app_module.API_MAX_AGE
+        etag = response.headers["ETag"]
+        rows = response.get_json()
+        assert [row["Ticker"] for row in rows] == ["ABEO", "TOTAL"]
+        assert rows[0]["Date"] == "2025-07-02"
+        
+        response = client.get("/api/portfolio", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.data == b""
+    
+    def test_csv_change_invalidates_caches(self, client, data_dir):
+        """Test that rewriting the CSV changes both the body and the ETag."""
+        first = client.get("/api/performance")
+        etag = first.headers["ETag"]
+        
+        _rewrite(data_dir / "chatgpt_portfolio_update.csv",
+                 PORTFOLIO_CSV + "2025-07-03,TOTAL,,,,,,36.00,1.38,,65.38,101.38\n")
+        
+        response = client.get("/api/performance", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+        assert [row["Total Equity"] for row in response.get_json()] == [99.46, 100.78, 101.38]
+    
+    def test_blank_date_is_not_latest(self, client, data_dir):
+        """Test that a row with a blank Date never becomes the latest date."""
+        _rewrite(data_dir / "chatgpt_portfolio_update.csv",
+                 PORTFOLIO_CSV + ",CADL,5.0,5.04,25.2,4.03,5.06,25.3,0.1,HOLD,,\n")
+        
+        rows = client.get("/api/portfolio").get_json()
+        assert [row["Ticker"] for row in rows] == ["ABEO", "TOTAL"]
+        assert {row["Date"] for row in rows} == {"2025-07-02"}
+        
+        response = client.get("/")
+        assert b"$100.78" in response.data
+        assert b"2025-07-02" in response.data
+    
+    def test_missing_trade_log(self, client, data_dir):
+        """Test that a missing CSV yields an empty list."""
+        (data_dir / "chatgpt_trade_log.csv").unlink()
+        response = client.get("/api/trades")
+        assert response.status_code == 200
+        assert response.get_json() == []
+
+
+class TestDashboard:
+    """Test the dashboard page, chart data and health check."""
+    
+    def test_dashboard_renders_stats(self, client):
+        """Test that the dashboard shows the latest TOTAL row."""
+        response = client.get("/")
+        assert response.status_code == 200
+        assert b"$100.78" in response.data
+        assert b"2025-07-02" in response.data
+    
+    def test_chart_values_are_scaled_cents(self):
+        """Test that chart values are integer cents and gaps are dropped."""
+        total_rows = pd.DataFrame({
+            "Date": pd.to_datetime(["2025-07-01", "2025-07-02", "2025-07-03"]),
+            "Total Equity": [99.46, float("nan"), 101.38],
+        })
+        chart = json.loads(app_module.create_simple_chart_data(total_rows))
+        
+        assert chart["scale"] == app_module.CHART_VALUE_SCALE
+        assert chart["dates"] == ["2025-07-01", "2025-07-03"]
+        assert chart["values"] == [9946, 10138]
+    
+    def test_health_rechecks_after_ttl(self, client, data_dir, monkeypatch):
+        """Test that file presence is cached for one TTL window only."""
+        now = [1000.0 * app_module.HEALTH_CHECK_TTL]
+        monkeypatch.setattr(app_module, "time", SimpleNamespace(time=lambda: now[0]))
+        
+        assert client.get("/health").get_json()["trade_file_exists"] is True
+        
+        (data_dir / "chatgpt_trade_log.csv").unlink()
+        assert client.get("/health").get_json()["trade_file_exists"] is True
+        
+        now[0] += app_module.HEALTH_CHECK_TTL
+        health = client.get("/health").get_json()
+        assert health["trade_file_exists"] is False
+        assert health["portfolio_file_exists"] is True
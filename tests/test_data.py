@@ -4,12 +4,6 @@ import pytest
 import pandas as pd
 import tempfile
 import os
-from pathlib import Path
-import sys
-
-# Add the project root to the Python path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(project_root))
 
 from src.data_fetcher import DataFetcher
 
@@ -49,10 +43,8 @@ class TestDataHandling:
             # Clean up
             os.unlink(temp_path)
     
-    def test_multiple_stocks_data_fetching(self):
+    def test_multiple_stocks_data_fetching(self, fetcher):
         """Test fetching data for multiple stocks."""
-        fetcher = DataFetcher()
-        
         # Test with a few major stocks
         tickers = ["AAPL", "MSFT"]
         prices = fetcher.get_multiple_prices(tickers)
@@ -67,14 +59,39 @@ class TestDataHandling:
                 if prices[ticker] is not None:
                     assert prices[ticker] > 0
 
+    
+    def test_multiple_prices_retries_missing_symbols(self, monkeypatch):
+        """Test that symbols a batch leaves out are fetched one by one."""
+        import yfinance as yf
+        
+        fetcher = DataFetcher()
+        looked_up = []
+        
+        def get_current_price(ticker):
+            looked_up.append(ticker)
+            return 2.0
+        
+        monkeypatch.setattr(fetcher, "get_current_price", get_current_price)
+        
+        # yf.download drops failed symbols instead of raising
+        columns = pd.MultiIndex.from_tuples([("AAA", "Close")])
+        partial = pd.DataFrame([[1.5]], columns=columns)
+        monkeypatch.setattr(yf, "download", lambda **kwargs: partial)
+        assert fetcher.get_multiple_prices(["AAA", "BBB"]) == {"AAA": 1.5, "BBB": 2.0}
+        assert looked_up == ["BBB"]
+        
+        # A wholly failed batch comes back as an empty frame
+        looked_up.clear()
+        monkeypatch.setattr(yf, "download", lambda **kwargs: pd.DataFrame())
+        assert fetcher.get_multiple_prices(["AAA", "BBB"]) == {"AAA": 2.0, "BBB": 2.0}
+        assert sorted(looked_up) == ["AAA", "BBB"]
+
 
 class TestDataValidation:
     """Test data validation and error handling."""
     
-    def test_invalid_ticker_handling(self):
+    def test_invalid_ticker_handling(self, fetcher):
         """Test handling of invalid ticker symbols."""
-        fetcher = DataFetcher()
-        
         # Test with obviously invalid ticker
         price = fetcher.get_current_price("INVALID_TICKER_12345")
         
@@ -0,0 +1,61 @@
+"""Smoke tests for the static report generator."""
+
+import json
+import re
+import xml.etree.ElementTree as ET
+
+from scripts import generate_reports
+
+
+PORTFOLIO_CSV = """Date,Ticker,Shares,Buy Price,Cost Basis,Stop Loss,Current Price,Total Value,PnL,Action,Cash Balance,Total Equity
+2025-07-01,ABEO,6.0,5.77,34.62,4.9,5.68,34.08,-0.54,HOLD,,
+2025-07-01,TOTAL,,,,,,34.08,-0.54,,65.38,99.46
+2025-07-02,ABEO,6.0,5.77,34.62,4.9,5.90,35.40,0.78,HOLD,,
+2025-07-02,TOTAL,,,,,,35.40,0.78,,65.38,100.78
+"""
+
+TRADE_CSV = """Date,Ticker,Shares Bought,Buy Price,Cost Basis,PnL,Reason,Shares Sold,Sell Price
+2025-07-01,ABEO,6.0,5.77,34.62,0.0,MANUAL BUY - </script> breakout,,
+"""
+
+
+def _script_json(html, element_id):
+    """Parse the JSON embedded in a ``<script type="application/json">`` tag."""
+    match = re.search(rf'<script type="application/json" id="{element_id}">(.*?)</script>', html, re.S)
+    return json.loads(match.group(1))
+
+
+class TestReports:
+    """Test that the generated report files are well formed."""
+    
+    def test_generate_reports(self, tmp_path):
+        """Test that the chart is valid SVG and the page embeds valid JSON."""
+        data_dir = tmp_path / "data"
+        reports_dir = tmp_path / "reports"
+        data_dir.mkdir()
+        reports_dir.mkdir()
+        (data_dir / "chatgpt_portfolio_update.csv").write_text(PORTFOLIO_CSV)
+        (data_dir / "chatgpt_trade_log.csv").write_text(TRADE_CSV)
+        
+        generate_reports.generate_performance_chart(data_dir, reports_dir)
+        generate_reports.generate_html_dashboard(data_dir, reports_dir)
+        
+        svg = ET.parse(reports_dir / "performance_chart.svg").getroot()
+        assert svg.tag.endswith("svg")
+        
+        html = (reports_dir / "index.html").read_text()
+        portfolio = _script_json(html, "portfolio-data")
+        trades = _script_json(html, "trade-data")
+        assert [row["Ticker"] for row in portfolio] == ["ABEO", "TOTAL", "ABEO", "TOTAL"]
+        # "</" inside the payload is escaped so it cannot close the tag early
+        assert trades[0]["Reason"] == "MANUAL BUY - </script> breakout"
+        assert '{TOTAL_TRADES}' not in html
+    
+    def test_missing_data_skips_chart(self, tmp_path):
+        """Test that missing CSVs produce an empty page and no chart."""
+        generate_reports.generate_performance_chart(tmp_path, tmp_path)
+        generate_reports.generate_html_dashboard(tmp_path, tmp_path)
+        
+        assert not (tmp_path / "performance_chart.svg").exists()
+        html = (tmp_path / "index.html").read_text()
+        assert _script_json(html, "portfolio-data") == []
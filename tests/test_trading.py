@@ -1,30 +1,70 @@
 """Basic tests for trading functionality."""
 
+import asyncio
+import io
+import json
 import pytest
-import sys
-from pathlib import Path
+import queue
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from types import SimpleNamespace
 import pandas as pd
 
-# Add the project root to the Python path
-project_root = Path(__file__).resolve().parent.parent
-sys.path.insert(0, str(project_root))
-
-from src.data_fetcher import DataFetcher
-from src.decision_maker import DecisionMaker
+from src.decision_maker import (
+    BuyAction, DecisionMaker, HoldAction, SellAction, iter_decisions,
+    pretty_print_log,
+)
 import trading_script
 
 
+class _ChatHandler(BaseHTTPRequestHandler):
+    """Keep-alive chat completions endpoint that HOLDs the requested ticker."""
+    protocol_version = "HTTP/1.1"
+    
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        ticker = json.loads(request["messages"][1]["content"].rsplit("\n", 2)[-2])["ticker"]
+        body = json.dumps({
+            "id": "chatcmpl-test", "object": "chat.completion", "created": 0, "model": "gpt-4",
+            "choices": [{"index": 0, "finish_reason": "stop", "message": {
+                "role": "assistant", "content": f"ACTIONS:\n- HOLD {ticker}: Fine\n"}}],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+    
+    def log_message(self, *args):
+        pass
+
+
+def _stream_chunk(text):
+    """A streamed chat completion chunk carrying ``text``."""
+    delta = SimpleNamespace(content=text)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+@pytest.fixture
+def chat_server():
+    """Base URL of a local chat completions server."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _ChatHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/v1"
+    server.shutdown()
+    server.server_close()
+
+
 class TestDataFetcher:
     """Test data fetching functionality."""
     
-    def test_data_fetcher_initialization(self):
+    def test_data_fetcher_initialization(self, fetcher):
         """Test that DataFetcher can be initialized."""
-        fetcher = DataFetcher()
         assert fetcher is not None
     
-    def test_get_current_price_basic(self):
+    def test_get_current_price_basic(self, fetcher):
         """Test basic price fetching functionality."""
-        fetcher = DataFetcher()
         # Test with a major stock that should always have data
         price = fetcher.get_current_price("AAPL")
         # Price should be a positive number or None (if market closed/error)
@@ -60,6 +100,188 @@ class TestDecisionMaker:
         assert len(prompt) > 0
         assert "PORTFOLIO SUMMARY" in prompt
         assert "CURRENT MARKET DATA" in prompt
+    
+    def test_parse_actions(self):
+        """Test parsing HOLD/SELL/BUY lines from a ChatGPT response."""
+        decision_maker = DecisionMaker()
+        
+        response = """ACTIONS:
+- HOLD ABEO: Thesis intact
+- SELL CSAI 15 at 2.28: Rotating into a stronger name
+  - BUY AZTR 55 at $0.25 stop_loss 0.20: New position
+- SELL BAD shares at 1.00: Malformed, should be skipped
+
+ANALYSIS:
+Markets were flat.
+"""
+        actions = decision_maker._parse_actions(response)
+        
+        assert actions == [
+            HoldAction("ABEO", "Thesis intact"),
+            SellAction("CSAI", 15, 2.28, "Rotating into a stronger name"),
+            BuyAction("AZTR", 55, 0.25, 0.2, "New position"),
+        ]
+        assert [a.action for a in actions] == ["HOLD", "SELL", "BUY"]
+    
+    def test_parse_actions_ignores_analysis(self):
+        """Test that only the ACTIONS section is parsed."""
+        decision_maker = DecisionMaker()
+        
+        assert decision_maker._parse_actions("ANALYSIS:\nNothing to do today.") == []
+        
+        response = """ACTIONS:
+- HOLD ABEO: Thesis intact
+
+ANALYSIS:
+- HOLD QUOTED: Example line inside the analysis
+"""
+        actions = decision_maker._parse_actions(response)
+        assert [a.ticker for a in actions] == ["ABEO"]
+    
+    def test_trading_decision_cache(self, tmp_path):
+        """Test that an identical snapshot is answered from the cache."""
+        decision_maker = DecisionMaker(cache_file=str(tmp_path / "cache.sqlite3"))
+        calls = []
+        
+        def create(**kwargs):
+            calls.append(kwargs)
+            message = SimpleNamespace(content="ACTIONS:\n- HOLD TEST: Fine\n")
+            return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+        
+        decision_maker.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        
+        first = decision_maker.get_trading_decision({"cash": 100.0, "positions": []}, {"TEST": 5.5})
+        # Same snapshot with keys in a different order
+        second = decision_maker.get_trading_decision({"positions": [], "cash": 100.0}, {"TEST": 5.5})
+        third = decision_maker.get_trading_decision({"cash": 90.0, "positions": []}, {"TEST": 5.5})
+        
+        assert len(calls) == 2
+        assert second["actions"] == first["actions"]
+        assert isinstance(second["actions"][0], HoldAction)
+        assert third is not None
+    
+    def test_decisions_batch(self, chat_server, monkeypatch):
+        """Test that batches work across repeated asyncio.run calls."""
+        monkeypatch.setenv("OPENAI_API_KEY", "test-key")
+        monkeypatch.setenv("OPENAI_BASE_URL", chat_server)
+        snapshots = [({"cash": 100.0}, {"ticker": t}) for t in ("AAA", "BBB")]
+        
+        with DecisionMaker(cache_file=None) as decision_maker:
+            # Each run has its own event loop; pooled connections from the
+            # first must not leak into the second
+            for _ in range(2):
+                decisions = asyncio.run(decision_maker.get_decisions_batch(snapshots))
+                assert [d["actions"][0].ticker for d in decisions] == ["AAA", "BBB"]
+            
+            for ticker in ("CCC", "DDD"):
+                decision = asyncio.run(
+                    decision_maker.get_trading_decision_async({"cash": 1.0}, {"ticker": ticker})
+                )
+                assert decision["actions"][0].ticker == ticker
+    
+    def test_stream_trading_decision(self):
+        """Test that streamed lines are parsed and queued as they complete."""
+        decision_maker = DecisionMaker(cache_file=None)
+        # An action line before the ACTIONS header counts in both parsers;
+        # lines under the ANALYSIS header that follows it do not
+        pieces = ["intro\n- HOLD PRE: x\n\nACTIONS:\n- HOLD AB", "C: Steady\n- SELL XYZ 10 at 2.5",
+                  "0: Stop-loss hit\n", "ANALYSIS:\n- HOLD NOPE: quoted"]
+        
+        def create(**kwargs):
+            assert kwargs["stream"] is True
+            for piece in pieces:
+                yield _stream_chunk(piece)
+        
+        decision_maker.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        
+        actions = queue.Queue()
+        decision = decision_maker.stream_trading_decision({"cash": 100.0}, {}, actions)
+        
+        assert decision["raw_response"] == "".join(pieces)
+        assert decision["actions"] == decision_maker._parse_actions(decision["raw_response"])
+        assert [actions.get_nowait().ticker for _ in range(3)] == ["PRE", "ABC", "XYZ"]
+        # A None terminal item marks a completed stream
+        assert actions.get_nowait() is None
+        assert actions.empty()
+    
+    def test_stream_actions_reach_consumer_mid_stream(self):
+        """Test that a consumer thread gets actions while generation continues."""
+        decision_maker = DecisionMaker(cache_file=None)
+        first_seen = threading.Event()
+        
+        def create(**kwargs):
+            yield _stream_chunk("ACTIONS:\n- HOLD AAA: First\n")
+            # Hold the stream open until the consumer has acted on AAA
+            assert first_seen.wait(timeout=5), "first action was not delivered mid-stream"
+            yield _stream_chunk("- HOLD BBB: Second\n")
+        
+        decision_maker.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        
+        actions = queue.Queue()
+        received = []
+        
+        def consume():
+            for item in iter(lambda: actions.get(timeout=10), None):
+                received.append(item)
+                first_seen.set()
+        
+        consumer = threading.Thread(target=consume)
+        consumer.start()
+        decision = decision_maker.stream_trading_decision({"cash": 100.0}, {}, actions)
+        consumer.join(timeout=10)
+        
+        assert not consumer.is_alive()
+        assert decision is not None
+        assert [item.ticker for item in received] == ["AAA", "BBB"]
+    
+    def test_stream_failure_is_signalled_on_queue(self):
+        """Test that a failed stream ends the queue with its exception."""
+        decision_maker = DecisionMaker(cache_file=None)
+        
+        def create(**kwargs):
+            yield _stream_chunk("ACTIONS:\n- HOLD AAA: Partial\n")
+            raise ConnectionError("stream dropped")
+        
+        decision_maker.client = SimpleNamespace(
+            chat=SimpleNamespace(completions=SimpleNamespace(create=create))
+        )
+        
+        actions = queue.Queue()
+        assert decision_maker.stream_trading_decision({"cash": 100.0}, {}, actions) is None
+        assert actions.get_nowait().ticker == "AAA"
+        assert isinstance(actions.get_nowait(), ConnectionError)
+        assert actions.empty()
+        
+        # Without a client the queue still gets a terminal error
+        decision_maker.client = None
+        assert decision_maker.stream_trading_decision({}, {}, actions) is None
+        assert isinstance(actions.get_nowait(), RuntimeError)
+    
+    def test_log_decision_appends_json_lines(self, tmp_path):
+        """Test that decisions are appended one per line and read back in order."""
+        decision_maker = DecisionMaker()
+        log_file = str(tmp_path / "decision_log.jsonl")
+        
+        decision_maker.log_decision({"timestamp": "1", "actions": []}, log_file)
+        decision_maker.log_decision({"timestamp": "2", "actions": [{"action": "HOLD"}]}, log_file)
+        
+        with open(log_file) as f:
+            assert len(f.readlines()) == 2
+        
+        decisions = list(iter_decisions(log_file))
+        assert [d["timestamp"] for d in decisions] == ["1", "2"]
+        assert decisions[1]["actions"] == [{"action": "HOLD"}]
+        
+        out = io.BytesIO()
+        pretty_print_log(log_file, out)
+        assert out.getvalue().count(b'"timestamp"') == 2
+        assert b'\n  "timestamp": "1"' in out.getvalue()
 
 
 class TestTradingScript:
@@ -92,6 +314,18 @@ class TestTradingScript:
         except Exception as e:
             # If there's an exception, it should be a controlled one
             assert "weekend" in str(e).lower() or "market" in str(e).lower()
+    
+    def test_append_trade_log(self, tmp_path, monkeypatch):
+        """Test that the trade log is created on first write and appended after."""
+        log_file = tmp_path / "chatgpt_trade_log.csv"
+        monkeypatch.setattr(trading_script, "TRADE_LOG_CSV", log_file)
+        
+        trading_script.append_trade_log({"Ticker": "ABC", "Shares Sold": 5})
+        trading_script.append_trade_log({"Ticker": "XYZ", "Shares Bought": 3})
+        
+        df = pd.read_csv(log_file)
+        assert df["Ticker"].tolist() == ["ABC", "XYZ"]
+        assert list(df.columns) == ["Ticker", "Shares Sold", "Shares Bought"]
 
 
 if __name__ == "__main__":
@@ -216,8 +216,11 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
     results.append(total_row)
 
     df = pd.DataFrame(results)
-    if PORTFOLIO_CSV.exists():
+    try:
         existing = pd.read_csv(PORTFOLIO_CSV)
+    except FileNotFoundError:
+        pass
+    else:
         existing = existing[existing["Date"] != today]
         print("Saving results to CSV...")
         time.sleep(1)
@@ -227,6 +230,17 @@ Would you like to log a manual trade? Enter 'b' for buy, 's' for sell, or press
     return portfolio_df, cash
 
 
+def append_trade_log(log: dict[str, object]) -> None:
+    """Append one trade record to ``TRADE_LOG_CSV``, creating it if needed."""
+    try:
+        df = pd.read_csv(TRADE_LOG_CSV)
+    except FileNotFoundError:
+        df = pd.DataFrame([log])
+    else:
+        df = pd.concat([df, pd.DataFrame([log])], ignore_index=True)
+    df.to_csv(TRADE_LOG_CSV, index=False)
+
+
 def log_sell(
     ticker: str,
     shares: float,
@@ -248,12 +262,7 @@ def log_sell(
     print(f"{ticker} stop loss was met. Selling all shares.")
     portfolio = portfolio[portfolio["ticker"] != ticker]
 
-    if TRADE_LOG_CSV.exists():
-        df = pd.read_csv(TRADE_LOG_CSV)
-        df = pd.concat([df, pd.DataFrame([log])], ignore_index=True)
-    else:
-        df = pd.DataFrame([log])
-    df.to_csv(TRADE_LOG_CSV, index=False)
+    append_trade_log(log)
     return portfolio
 
 
@@ -316,12 +325,7 @@ def log_manual_buy(
         "Reason": "MANUAL BUY - New position",
     }
 
-    if os.path.exists(TRADE_LOG_CSV):
-        df = pd.read_csv(TRADE_LOG_CSV)
-        df = pd.concat([df, pd.DataFrame([log])], ignore_index=True)
-    else:
-        df = pd.DataFrame([log])
-    df.to_csv(TRADE_LOG_CSV, index=False)
+    append_trade_log(log)
 
     # === Update portfolio DataFrame ===
     rows = chatgpt_portfolio.loc[
@@ -429,12 +433,7 @@ If this is a mistake, enter 1. """
         "Shares Sold": shares_sold,
         "Sell Price": sell_price,
     }
-    if os.path.exists(TRADE_LOG_CSV):
-        df = pd.read_csv(TRADE_LOG_CSV)
-        df = pd.concat([df, pd.DataFrame([log])], ignore_index=True)
-    else:
-        df = pd.DataFrame([log])
-    df.to_csv(TRADE_LOG_CSV, index=False)
+    append_trade_log(log)
 
     if total_shares == shares_sold:
         chatgpt_portfolio = chatgpt_portfolio[chatgpt_portfolio["ticker"] != ticker]
@@ -563,6 +562,7 @@ def main(file: str, data_dir: Path | None = None) -> None:
 
 def load_latest_portfolio_state(
     file: str,
+    engine: str | None = None,
 ) -> tuple[pd.DataFrame | list[dict[str, Any]], float]:
     """Load the most recent portfolio snapshot and cash balance.
 
@@ -570,6 +570,9 @@ def load_latest_portfolio_state(
     ----------
     file:
         CSV file containing historical portfolio records.
+    engine:
+        Parser passed to ``pd.read_csv``; ``None`` uses the pandas default.
+        ``"pyarrow"`` selects the multithreaded Arrow reader.
 
     Returns
     -------
@@ -578,7 +581,7 @@ def load_latest_portfolio_state(
         list of row dictionaries) and the associated cash balance.
     """
 
-    df = pd.read_csv(file)
+    df = pd.read_csv(file, engine=engine)
     if df.empty:
         portfolio = pd.DataFrame([])
         print(
@@ -591,19 +594,22 @@ def load_latest_portfolio_state(
                 "Cash could not be converted to float datatype. Please enter a valid number."
             )
         return portfolio, cash
-    non_total = df[df["Ticker"] != "TOTAL"].copy()
-    non_total["Date"] = pd.to_datetime(non_total["Date"])
+    # Filtering already yields new frames, so no defensive copies are needed;
+    # an explicit format keeps to_datetime on its fast path
+    non_total = df[df["Ticker"] != "TOTAL"]
+    non_total = non_total.assign(
+        Date=pd.to_datetime(non_total["Date"].values, format="%Y-%m-%d", cache=True)
+    )
 
     latest_date = non_total["Date"].max()
     # Get all tickers from the latest date
-    latest_tickers = non_total[non_total["Date"] == latest_date].copy()
+    latest_tickers = non_total[non_total["Date"] == latest_date]
     sold_mask = latest_tickers["Action"].astype(str).str.startswith("SELL")
-    latest_tickers = latest_tickers[~sold_mask].copy()
-    latest_tickers.drop(columns=["Date", "Cash Balance", "Total Equity", "Action", "Current Price", "PnL", "Total Value"], inplace=True)
-    latest_tickers.rename(columns={"Cost Basis": "cost_basis", "Buy Price": "buy_price", "Shares": "shares", "Ticker": "ticker", "Stop Loss": "stop_loss"}, inplace=True)
+    latest_tickers = latest_tickers[~sold_mask].drop(columns=["Date", "Cash Balance", "Total Equity", "Action", "Current Price", "PnL", "Total Value"])
+    latest_tickers = latest_tickers.rename(columns={"Cost Basis": "cost_basis", "Buy Price": "buy_price", "Shares": "shares", "Ticker": "ticker", "Stop Loss": "stop_loss"})
     latest_tickers = latest_tickers.reset_index(drop=True).to_dict(orient='records')
     df = df[df["Ticker"] == "TOTAL"]  # Only the total summary rows
-    df["Date"] = pd.to_datetime(df["Date"])
+    df = df.assign(Date=pd.to_datetime(df["Date"].values, format="%Y-%m-%d", cache=True))
     latest = df.sort_values("Date").iloc[-1]
     cash = float(latest["Cash Balance"])
     return latest_tickers, cash